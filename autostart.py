@@ -0,0 +1,52 @@
+"""Windows 로그온 시 트레이 앱 자동 실행 (HKCU Run 레지스트리)."""
+
+import os
+import sys
+
+from brand import APP_NAME
+
+AUTOSTART_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+TRAY_SCRIPT = os.path.join(os.path.dirname(os.path.realpath(__file__)), "tray.py")
+
+
+def _command() -> str:
+    """Run 키에 기록할 트레이 앱 실행 명령을 만든다."""
+    if getattr(sys, "frozen", False):  # PyInstaller로 빌드된 exe
+        return f'"{sys.executable}"'
+    # 콘솔 창 없이 상주하도록 가능하면 pythonw.exe 사용
+    pythonw = os.path.join(os.path.dirname(sys.executable), "pythonw.exe")
+    exe = pythonw if os.path.exists(pythonw) else sys.executable
+    return f'"{exe}" "{TRAY_SCRIPT}"'
+
+
+def is_enabled() -> bool:
+    import winreg
+    try:
+        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTOSTART_KEY, 0, winreg.KEY_READ)
+        winreg.QueryValueEx(key, APP_NAME)
+        winreg.CloseKey(key)
+        return True
+    except OSError:
+        return False
+
+
+def enable() -> None:
+    """Run 키에 트레이 앱을 등록한다. 실패 시 OSError."""
+    import winreg
+    key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTOSTART_KEY, 0, winreg.KEY_SET_VALUE)
+    try:
+        winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, _command())
+    finally:
+        winreg.CloseKey(key)
+
+
+def disable() -> None:
+    """Run 키에서 트레이 앱을 제거한다. 등록되어 있지 않으면 무시한다."""
+    import winreg
+    key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTOSTART_KEY, 0, winreg.KEY_SET_VALUE)
+    try:
+        winreg.DeleteValue(key, APP_NAME)
+    except FileNotFoundError:
+        pass
+    finally:
+        winreg.CloseKey(key)
@@ -1,21 +1,26 @@
 """메인 모니터링 스크립트 - rules + notifier 조합."""
 
 import ctypes
-import ctypes.wintypes
+import functools
 import os
-import sys
-from pathlib import Path
+import time
+import uuid
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml C 로더
+except ImportError:
+    from yaml import SafeLoader
+
 from rules import evaluate_bookmarks, evaluate_folder
 from notifier import send_bookmark_notification, send_notification
 
-CONFIG_PATH = Path(__file__).parent / "config.yaml"
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config.yaml")
 
-BOOKMARKS_PATH = (
-    Path(os.environ.get("LOCALAPPDATA", ""))
-    / "Google" / "Chrome" / "User Data" / "Default" / "Bookmarks"
+BOOKMARKS_PATH = os.path.join(
+    os.environ.get("LOCALAPPDATA", ""),
+    "Google", "Chrome", "User Data", "Default", "Bookmarks",
 )
 
 # Windows Known Folder GUIDs
@@ -28,18 +33,23 @@ _KNOWN_FOLDERS: dict[str, str] = {
     "Music": "{4BD8D571-6D19-48D3-BE97-422220080E43}",
 }
 
+# KNOWNFOLDERID 버퍼를 임포트 시 한 번만 만든다 (bytes_le = Windows GUID 메모리 배치)
+_KNOWN_FOLDER_GUIDS: dict[str, ctypes.Array] = {
+    name: ctypes.create_string_buffer(uuid.UUID(guid_str).bytes_le, 16)
+    for name, guid_str in _KNOWN_FOLDERS.items()
+}
+
 
 def get_known_folder_path(folder_name: str) -> str:
     """SHGetKnownFolderPath로 Windows 특수 폴더 경로를 얻는다."""
-    guid_str = _KNOWN_FOLDERS.get(folder_name)
-    if guid_str is None:
+    guid = _KNOWN_FOLDER_GUIDS.get(folder_name)
+    if guid is None:
         raise ValueError(f"알 수 없는 폴더: {folder_name} (지원: {', '.join(_KNOWN_FOLDERS)})")
 
-    guid = ctypes.create_string_buffer(16)
-    ctypes.windll.ole32.CLSIDFromString(guid_str, guid)
-
     buf = ctypes.c_wchar_p()
-    hr = ctypes.windll.shell32.SHGetKnownFolderPath(guid, 0, None, ctypes.byref(buf))
+    hr = ctypes.windll.shell32.SHGetKnownFolderPath(
+        ctypes.byref(guid), 0, None, ctypes.byref(buf)
+    )
     if hr != 0:
         raise OSError(f"SHGetKnownFolderPath 실패 (HRESULT={hr:#x})")
 
@@ -48,32 +58,53 @@ def get_known_folder_path(folder_name: str) -> str:
     return path
 
 
+@functools.lru_cache(maxsize=16)
+def _resolve_shell(folder_name: str) -> str:
+    """특수 폴더 경로 조회 결과를 프로세스 수명 동안 캐시한다."""
+    return get_known_folder_path(folder_name)
+
+
 def resolve_path(path: str) -> str:
     """'shell:Desktop' 같은 토큰을 실제 경로로 변환한다."""
     if path.startswith("shell:"):
         folder_name = path[len("shell:"):]
-        return get_known_folder_path(folder_name)
+        return _resolve_shell(folder_name)
     return path
 
 
+# 마지막으로 읽은 설정 파일의 mtime과 파싱 결과
+_cfg_cache: dict = {"mtime": None, "data": None}
+
+
 def load_config() -> dict:
+    """설정을 읽는다. 파일이 바뀌지 않았으면 캐시된 결과를 돌려준다."""
+    mtime = os.stat(CONFIG_PATH).st_mtime_ns
+    if mtime == _cfg_cache["mtime"]:
+        return _cfg_cache["data"]
+
     with open(CONFIG_PATH, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
     for folder_cfg in config.get("folders", []):
         folder_cfg["path"] = resolve_path(folder_cfg["path"])
+
+    _cfg_cache["mtime"] = mtime
+    _cfg_cache["data"] = config
     return config
 
 
 def run() -> None:
     config = load_config()
 
+    now = time.time()  # 모든 폴더가 같은 기준 시각을 쓴다
     for folder_cfg in config["folders"]:
+        stale_days = folder_cfg.get("stale_days", 7)
         report = evaluate_folder(
             folder_path=folder_cfg["path"],
             max_files=folder_cfg.get("max_files", 20),
             max_extensions=folder_cfg.get("max_extensions", 8),
             max_stale_files=folder_cfg.get("max_stale_files", 10),
-            stale_days=folder_cfg.get("stale_days", 7),
+            stale_days=stale_days,
+            stale_threshold=now - (stale_days * 86400),
         )
 
         if report.level != "clean":
@@ -89,9 +120,9 @@ def run() -> None:
 
     # 북마크 검사
     bm_cfg = config.get("bookmarks", {})
-    if bm_cfg.get("enabled", True) and BOOKMARKS_PATH.exists():
+    if bm_cfg.get("enabled", True) and os.path.exists(BOOKMARKS_PATH):
         bm_report = evaluate_bookmarks(
-            bookmarks_path=str(BOOKMARKS_PATH),
+            bookmarks_path=BOOKMARKS_PATH,
             max_unsorted=bm_cfg.get("max_unsorted", 10),
             max_duplicates=bm_cfg.get("max_duplicates", 5),
             max_unused_percent=bm_cfg.get("max_unused_percent", 50),
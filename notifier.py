@@ -27,34 +27,46 @@ LEVEL_CONFIG = {
 }
 
 
+# 레벨별 (title, duration, audio) — 알림마다 dict 조회를 반복하지 않도록 미리 풀어 둔다
+_TOAST_CONFIG = {
+    level: (cfg["title"], cfg["duration"], cfg["audio"])
+    for level, cfg in LEVEL_CONFIG.items()
+}
+
+
 def _folder_name(path: str) -> str:
     """경로에서 폴더 표시 이름을 추출한다."""
     name = path.rstrip("/\\").rsplit("\\", 1)[-1].rsplit("/", 1)[-1]
     return name
 
 
+def _send(level: str, header: str, reasons: list[str], footer: str) -> None:
+    """헤더 / 사유 목록 / 안내 문구로 본문을 구성해 토스트 알림을 보낸다."""
+    title, duration, sound = _TOAST_CONFIG[level]
+    body = "\n".join([header, *(f"  • {reason}" for reason in reasons), footer])
+
+    toast = Notification(
+        app_id=APP_NAME,
+        title=title,
+        msg=body,
+        duration=duration,
+    )
+    toast.set_audio(sound, loop=False)
+    toast.show()
+
+
 def send_notification(report: FolderReport) -> None:
     """FolderReport를 기반으로 토스트 알림을 보낸다."""
     if report.level == "clean":
         return
 
-    cfg = LEVEL_CONFIG[report.level]
     folder = _folder_name(report.path)
-
-    body_lines = [f"🗂 {folder}에 파일 {report.total_files}개!"]
-    for reason in report.reasons:
-        body_lines.append(f"  • {reason}")
-    body_lines.append("정리가 필요합니다.")
-    body = "\n".join(body_lines)
-
-    toast = Notification(
-        app_id=APP_NAME,
-        title=cfg["title"],
-        msg=body,
-        duration=cfg["duration"],
+    _send(
+        report.level,
+        f"🗂 {folder}에 파일 {report.total_files}개!",
+        report.reasons,
+        "정리가 필요합니다.",
     )
-    toast.set_audio(cfg["audio"], loop=False)
-    toast.show()
 
 
 def send_bookmark_notification(report: BookmarkReport) -> None:
@@ -62,19 +74,9 @@ def send_bookmark_notification(report: BookmarkReport) -> None:
     if report.level == "clean":
         return
 
-    cfg = LEVEL_CONFIG[report.level]
-
-    body_lines = [f"🔖 북마크 {report.total_bookmarks}개"]
-    for reason in report.reasons:
-        body_lines.append(f"  • {reason}")
-    body_lines.append("북마크 정리가 필요합니다.")
-    body = "\n".join(body_lines)
-
-    toast = Notification(
-        app_id=APP_NAME,
-        title=cfg["title"],
-        msg=body,
-        duration=cfg["duration"],
+    _send(
+        report.level,
+        f"🔖 북마크 {report.total_bookmarks}개",
+        report.reasons,
+        "북마크 정리가 필요합니다.",
     )
-    toast.set_audio(cfg["audio"], loop=False)
-    toast.show()
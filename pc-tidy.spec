@@ -5,7 +5,8 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[("config.yaml", ".")],
-    hiddenimports=[],
+    # ijson은 파서 백엔드를 importlib로 런타임에 고르므로 정적 분석에 잡히지 않는다
+    hiddenimports=["ijson.backends.yajl2_c", "ijson.backends.python"],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
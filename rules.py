@@ -1,11 +1,12 @@
 """더러움 판단 규칙 엔진."""
 
-import json
 import os
 import time
-from collections import Counter
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from pathlib import Path
+from typing import BinaryIO
+
+import ijson
 
 
 @dataclass
@@ -34,16 +35,39 @@ def evaluate_folder(
     max_extensions: int = 8,
     max_stale_files: int = 10,
     stale_days: int = 7,
+    stale_threshold: float | None = None,
 ) -> FolderReport:
-    """폴더 상태를 평가하고 더러움 점수를 산출한다."""
+    """폴더 상태를 평가하고 더러움 점수를 산출한다.
+
+    stale_threshold(epoch 초)를 주면 방치 기준 시각으로 그대로 쓰고, 없으면 stale_days로 계산한다.
+    """
     report = FolderReport(path=folder_path)
-    path = Path(folder_path)
 
-    if not path.exists():
+    if not os.path.exists(folder_path):
         return report
 
-    files = [f for f in path.iterdir() if f.is_file()]
-    report.total_files = len(files)
+    if stale_threshold is None:
+        stale_threshold = time.time() - (stale_days * 86400)
+
+    # 한 번의 순회로 파일 수 / 확장자 / 오래된 파일을 함께 집계한다.
+    # DirEntry는 디렉터리 열거 시 얻은 메타데이터를 캐시하므로 별도 stat 호출이 줄어든다
+    extensions: set[str] = set()
+    with os.scandir(folder_path) as it:
+        for e in it:
+            try:
+                if not e.is_file():
+                    continue
+                report.total_files += 1
+                # PurePath.suffix와 같은 규칙: 선행/후행 점은 확장자가 아니다
+                name = e.name
+                dot = name.rfind(".")
+                if 0 < dot < len(name) - 1:
+                    extensions.add(name[dot:].lower())
+                if e.stat().st_mtime < stale_threshold:
+                    report.stale_file_count += 1
+            except OSError:
+                continue  # 검사 도중 삭제된 파일
+    report.extension_count = len(extensions)
 
     # 규칙 1: 파일 개수 초과
     if report.total_files > max_files:
@@ -51,8 +75,6 @@ def evaluate_folder(
         report.reasons.append(f"파일 {report.total_files}개 (기준: {max_files}개)")
 
     # 규칙 2: 확장자 종류 혼재
-    extensions = {f.suffix.lower() for f in files if f.suffix}
-    report.extension_count = len(extensions)
     if report.extension_count > max_extensions:
         report.score += 1
         report.reasons.append(
@@ -60,10 +82,6 @@ def evaluate_folder(
         )
 
     # 규칙 3: 오래된 파일
-    now = time.time()
-    stale_threshold = now - (stale_days * 86400)
-    stale_files = [f for f in files if f.stat().st_mtime < stale_threshold]
-    report.stale_file_count = len(stale_files)
     if report.stale_file_count > max_stale_files:
         report.score += 1
         report.reasons.append(
@@ -98,12 +116,38 @@ class BookmarkReport:
         return "clean"
 
 
-def _collect_urls(node: dict, urls: list[dict]) -> None:
-    """북마크 트리를 재귀 순회하며 URL 항목을 수집한다."""
-    if node.get("type") == "url":
-        urls.append(node)
-    for child in node.get("children", []):
-        _collect_urls(child, urls)
+# 북마크 노드에서 읽어 들이는 문자열 필드
+_URL_FIELDS = frozenset({"type", "url", "date_last_used"})
+
+# 북마크바 루트 바로 아래 항목의 ijson prefix
+_BOOKMARK_BAR_ROOT_ITEM = "roots.bookmark_bar.children.item"
+
+# 마지막 분석 결과 (파일 mtime/크기와 기준값이 같으면 재사용)
+_bookmark_cache: dict = {"key": None, "report": None}
+
+
+def _iter_urls(f: BinaryIO) -> Iterator[tuple[str, dict[str, str]]]:
+    """북마크 파일을 스트리밍 파싱하며 URL 노드를 (prefix, 필드)로 하나씩 내보낸다."""
+    # 재귀 대신 명시적 스택: 열린 JSON 객체마다 (prefix, 필드 dict)를 쌓고,
+    # 북마크 노드가 아닌 객체는 필드를 None으로 둔다.
+    stack: list[tuple[str, dict[str, str] | None]] = []
+    for prefix, event, value in ijson.parse(f):
+        if event == "start_map":
+            is_node = False
+            if len(stack) == 2 and stack[1][0] == "roots":
+                is_node = True  # roots 바로 아래 최상위 폴더
+            elif stack and stack[-1][1] is not None:
+                is_node = prefix == stack[-1][0] + ".children.item"
+            stack.append((prefix, {} if is_node else None))
+        elif event == "end_map":
+            node_prefix, node = stack.pop()
+            if node is not None and node.get("type") == "url":
+                yield node_prefix, node
+        elif event == "string" and stack and stack[-1][1] is not None:
+            node_prefix, node = stack[-1]
+            key = prefix[len(node_prefix) + 1:]
+            if key in _URL_FIELDS:
+                node[key] = value
 
 
 def evaluate_bookmarks(
@@ -114,28 +158,40 @@ def evaluate_bookmarks(
 ) -> BookmarkReport:
     """Chrome 북마크 파일을 분석하고 더러움 점수를 산출한다."""
     report = BookmarkReport()
-    path = Path(bookmarks_path)
 
-    if not path.exists():
+    try:
+        st = os.stat(bookmarks_path)
+    except FileNotFoundError:
         return report
 
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
-
-    # 전체 URL 수집
-    all_urls: list[dict] = []
-    for root_node in data.get("roots", {}).values():
-        if isinstance(root_node, dict):
-            _collect_urls(root_node, all_urls)
+    cache_key = (
+        bookmarks_path, st.st_mtime_ns, st.st_size,
+        max_unsorted, max_duplicates, max_unused_percent,
+    )
+    if cache_key == _bookmark_cache["key"]:
+        return _bookmark_cache["report"]
+
+    url_counts: dict[str, int] = {}
+    with open(bookmarks_path, "rb") as f:
+        for node_prefix, node in _iter_urls(f):
+            report.total_bookmarks += 1
+            url = node.get("url", "")
+            count = url_counts.get(url, 0) + 1
+            url_counts[url] = count
+            if count == 2:
+                report.duplicate_count += 1  # 두 번째 등장 시 한 번만 센다
+            if node.get("date_last_used", "0") == "0":
+                report.unused_count += 1
+            if node_prefix == _BOOKMARK_BAR_ROOT_ITEM:
+                report.unsorted_count += 1
+
+    _bookmark_cache["key"] = cache_key
+    _bookmark_cache["report"] = report
 
-    report.total_bookmarks = len(all_urls)
     if report.total_bookmarks == 0:
         return report
 
     # 규칙 1: 북마크바 루트에 폴더 밖 URL 과다
-    bookmark_bar = data.get("roots", {}).get("bookmark_bar", {})
-    unsorted = [c for c in bookmark_bar.get("children", []) if c.get("type") == "url"]
-    report.unsorted_count = len(unsorted)
     if report.unsorted_count > max_unsorted:
         report.score += 1
         report.reasons.append(
@@ -143,9 +199,6 @@ def evaluate_bookmarks(
         )
 
     # 규칙 2: 중복 URL
-    url_counts = Counter(item["url"] for item in all_urls)
-    duplicates = {url: cnt for url, cnt in url_counts.items() if cnt > 1}
-    report.duplicate_count = len(duplicates)
     if report.duplicate_count > max_duplicates:
         report.score += 1
         report.reasons.append(
@@ -153,8 +206,6 @@ def evaluate_bookmarks(
         )
 
     # 규칙 3: 미사용 북마크 비율
-    unused = [item for item in all_urls if item.get("date_last_used", "0") == "0"]
-    report.unused_count = len(unused)
     unused_percent = (report.unused_count / report.total_bookmarks) * 100
     if unused_percent > max_unused_percent:
         report.score += 1
@@ -1,67 +1,45 @@
-"""Windows 작업 스케줄러에 모니터링 작업을 등록/해제한다."""
+"""로그온 시 트레이 앱 자동 실행을 등록/해제한다."""
 
 import subprocess
 import sys
-from pathlib import Path
-
-import yaml
 
+import autostart
 from brand import APP_NAME
-CONFIG_PATH = Path(__file__).parent / "config.yaml"
-MONITOR_SCRIPT = Path(__file__).parent / "monitor.py"
-
 
-def load_config() -> dict:
-    with open(CONFIG_PATH, encoding="utf-8") as f:
-        return yaml.safe_load(f)
 
-
-def register() -> None:
-    """작업 스케줄러에 등록한다."""
-    config = load_config()
-    interval = config.get("check_interval_minutes", 60)
-    python_exe = sys.executable
-
-    # 기존 작업 삭제 (무시)
+def _delete_legacy_task() -> None:
+    """이전 버전이 등록한 작업 스케줄러 작업을 삭제한다 (없으면 무시)."""
+    # 남아 있으면 트레이와 별개로 monitor.py가 주기 실행되어 알림이 중복된다
     subprocess.run(
         ["schtasks", "/Delete", "/TN", APP_NAME, "/F"],
         capture_output=True,
     )
 
-    result = subprocess.run(
-        [
-            "schtasks",
-            "/Create",
-            "/TN", APP_NAME,
-            "/TR", f'"{python_exe}" "{MONITOR_SCRIPT}"',
-            "/SC", "MINUTE",
-            "/MO", str(interval),
-            "/F",
-        ],
-        capture_output=True,
-        text=True,
-    )
 
-    if result.returncode == 0:
-        print(f"작업 '{APP_NAME}' 등록 완료 ({interval}분 간격)")
-    else:
-        print(f"등록 실패: {result.stderr}")
+def register() -> None:
+    """로그온 시 트레이 앱이 실행되도록 등록한다."""
+    # 검사마다 인터프리터를 새로 띄우지 않도록 로그온 시 트레이 앱을 한 번 실행하고,
+    # 주기 검사는 상주하는 트레이 앱이 check_interval_minutes 간격으로 맡는다.
+    # 트레이 메뉴의 "Windows 시작 시 실행"과 같은 HKCU Run 항목이라 중복 실행되지 않고,
+    # 관리자 권한도 필요 없다.
+    _delete_legacy_task()
+    try:
+        autostart.enable()
+    except OSError as e:
+        print(f"등록 실패: {e}")
         sys.exit(1)
+    print(f"'{APP_NAME}' 등록 완료 (로그온 시 트레이 실행)")
 
 
 def unregister() -> None:
-    """작업 스케줄러에서 해제한다."""
-    result = subprocess.run(
-        ["schtasks", "/Delete", "/TN", APP_NAME, "/F"],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode == 0:
-        print(f"작업 '{APP_NAME}' 해제 완료")
-    else:
-        print(f"해제 실패: {result.stderr}")
+    """로그온 시 자동 실행을 해제한다."""
+    _delete_legacy_task()
+    try:
+        autostart.disable()
+    except OSError as e:
+        print(f"해제 실패: {e}")
         sys.exit(1)
+    print(f"'{APP_NAME}' 해제 완료")
 
 
 if __name__ == "__main__":
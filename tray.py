@@ -1,20 +1,18 @@
 """시스템 트레이 상주 앱 - pystray + Pillow."""
 
 import os
-import sys
 import threading
-from pathlib import Path
+import time
 
 import pystray
 from PIL import Image, ImageDraw
 
+import autostart
 from brand import APP_NAME
 from monitor import BOOKMARKS_PATH, CONFIG_PATH, load_config
 from notifier import send_bookmark_notification, send_notification
 from rules import BookmarkReport, FolderReport, evaluate_bookmarks, evaluate_folder
 
-AUTOSTART_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
-
 LEVEL_COLORS = {
     "clean": (76, 175, 80),      # green
     "caution": (255, 235, 59),    # yellow
@@ -67,43 +65,22 @@ def _make_icon(status_color: tuple[int, int, int]) -> Image.Image:
     return img
 
 
+# 레벨별 아이콘은 임포트 시 한 번만 그리고 이후에는 재사용한다
+_ICONS = {level: _make_icon(color) for level, color in LEVEL_COLORS.items()}
+
+
 # ---------------------------------------------------------------------------
 # Autostart (Registry)
 # ---------------------------------------------------------------------------
 
-def _is_autostart_enabled() -> bool:
-    import winreg
+def _toggle_autostart() -> None:
     try:
-        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTOSTART_KEY, 0, winreg.KEY_READ)
-        winreg.QueryValueEx(key, APP_NAME)
-        winreg.CloseKey(key)
-        return True
-    except FileNotFoundError:
-        return False
+        if autostart.is_enabled():
+            autostart.disable()
+        else:
+            autostart.enable()
     except OSError:
-        return False
-
-
-def _toggle_autostart() -> None:
-    import winreg
-    if _is_autostart_enabled():
-        try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTOSTART_KEY, 0, winreg.KEY_SET_VALUE)
-            winreg.DeleteValue(key, APP_NAME)
-            winreg.CloseKey(key)
-        except OSError:
-            pass
-    else:
-        exe = sys.executable
-        # uv run 환경이면 entrypoint 사용, 아니면 python tray.py
-        script = Path(__file__).resolve()
-        cmd = f'"{exe}" "{script}"'
-        try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTOSTART_KEY, 0, winreg.KEY_SET_VALUE)
-            winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, cmd)
-            winreg.CloseKey(key)
-        except OSError:
-            pass
+        pass
 
 
 # ---------------------------------------------------------------------------
@@ -130,21 +107,25 @@ class TrayApp:
         self._stop_event = threading.Event()
         self._scan_event = threading.Event()
         self.icon: pystray.Icon | None = None
+        self._menu_sig: tuple | None = None  # 마지막으로 반영한 (폴더별 상태, 북마크 상태)
 
     # -- scanning --
 
     def _run_scan(self) -> None:
         """모든 폴더를 검사하고 결과를 갱신한다."""
-        config = load_config()  # 매번 리로드 (설정 변경 반영)
+        config = load_config()  # 설정 파일이 바뀌었을 때만 다시 파싱
         self.config = config
         reports = []
+        now = time.time()  # 모든 폴더가 같은 기준 시각을 쓴다
         for folder_cfg in config["folders"]:
+            stale_days = folder_cfg.get("stale_days", 7)
             report = evaluate_folder(
                 folder_path=folder_cfg["path"],
                 max_files=folder_cfg.get("max_files", 20),
                 max_extensions=folder_cfg.get("max_extensions", 8),
                 max_stale_files=folder_cfg.get("max_stale_files", 10),
-                stale_days=folder_cfg.get("stale_days", 7),
+                stale_days=stale_days,
+                stale_threshold=now - (stale_days * 86400),
             )
             reports.append(report)
         self.reports = reports
@@ -156,9 +137,9 @@ class TrayApp:
 
         # 북마크 검사
         bm_cfg = config.get("bookmarks", {})
-        if bm_cfg.get("enabled", True) and BOOKMARKS_PATH.exists():
+        if bm_cfg.get("enabled", True) and os.path.exists(BOOKMARKS_PATH):
             self.bookmark_report = evaluate_bookmarks(
-                bookmarks_path=str(BOOKMARKS_PATH),
+                bookmarks_path=BOOKMARKS_PATH,
                 max_unsorted=bm_cfg.get("max_unsorted", 10),
                 max_duplicates=bm_cfg.get("max_duplicates", 5),
                 max_unused_percent=bm_cfg.get("max_unused_percent", 50),
@@ -181,8 +162,16 @@ class TrayApp:
     def _update_icon(self) -> None:
         if self.icon is None:
             return
+        # 메뉴와 아이콘은 폴더 경로/레벨과 북마크 레벨로만 결정되므로 바뀌지 않았으면 건너뛴다
+        sig = (
+            tuple((r.path, r.level) for r in self.reports),
+            self.bookmark_report.level if self.bookmark_report is not None else None,
+        )
+        if sig == self._menu_sig:
+            return
+        self._menu_sig = sig
         level = self._worst_level()
-        self.icon.icon = _make_icon(LEVEL_COLORS[level])
+        self.icon.icon = _ICONS[level]
         self.icon.title = f"{APP_NAME} - {LEVEL_LABEL[level]}"
         self.icon.menu = self._build_menu()
 
@@ -206,7 +195,7 @@ class TrayApp:
         os.startfile("chrome://bookmarks")
 
     def _on_open_config(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
-        os.startfile(str(CONFIG_PATH))
+        os.startfile(CONFIG_PATH)
 
     def _on_toggle_autostart(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
         _toggle_autostart()
@@ -252,7 +241,7 @@ class TrayApp:
             pystray.MenuItem(
                 "Windows 시작 시 실행",
                 self._on_toggle_autostart,
-                checked=lambda item: _is_autostart_enabled(),
+                checked=lambda item: autostart.is_enabled(),
             )
         )
 
@@ -266,7 +255,7 @@ class TrayApp:
     def run(self) -> None:
         self.icon = pystray.Icon(
             name=APP_NAME,
-            icon=_make_icon(LEVEL_COLORS["clean"]),
+            icon=_ICONS["clean"],
             title=f"{APP_NAME} - 시작 중...",
             menu=self._build_menu(),
         )